@@ -25,10 +25,12 @@ Author: moontato
 
 from __future__ import annotations
 
-import os
+import functools
+import queue
 import sqlite3
 import threading
 import time
+from collections.abc import Callable, Iterable
 from datetime import datetime
 from pathlib import Path
 
@@ -36,42 +38,194 @@ import tkinter as tk
 from tkinter import messagebox, simpledialog, ttk
 
 DB_PATH = Path(__file__).with_name("study_sessions.db")
+# Number of sessions fetched at a time by the session viewer
+SESSION_PAGE_SIZE = 200
+
+# Statements issued repeatedly by ``SessionDatabase``.  Reusing the same
+# strings lets sqlite3's statement cache skip re-parsing them.
+_SQL_INSERT = "INSERT INTO sessions (start_time, end_time, duration, notes) VALUES (?, ?, ?, ?)"
+_SQL_LIST_COLUMNS = """
+    SELECT id,
+           strftime('%Y-%m-%d %H:%M', start_time / 1000000, 'unixepoch', 'localtime'),
+           CAST(duration AS INTEGER) / 3600,
+           CAST(duration AS INTEGER) / 60 % 60,
+           CAST(duration AS INTEGER) % 60,
+           start_time
+    FROM sessions
+"""
+_SQL_LIST_FIRST = _SQL_LIST_COLUMNS + "ORDER BY start_time DESC, id DESC LIMIT ?"
+_SQL_LIST_AFTER = (
+    _SQL_LIST_COLUMNS + "WHERE (start_time, id) < (?, ?) ORDER BY start_time DESC, id DESC LIMIT ?"
+)
+_SQL_GET = "SELECT id, start_time, end_time, duration, notes FROM sessions WHERE id = ?"
+_SQL_GET_META = "SELECT id, start_time, end_time, duration FROM sessions WHERE id = ?"
+_SQL_DELETE = "DELETE FROM sessions WHERE id = ?"
+
+# Tcl lambda that appends each row in ``rows`` to the treeview ``w``
+_TCL_INSERT_ROWS = "{w rows} {foreach v $rows {$w insert {} end -values $v}}"
+
+
+def _to_micros(moment: datetime) -> int:
+    """Return ``moment`` as integer Unix microseconds for storage."""
+    return int(moment.timestamp() * 1_000_000)
+
+
+def _from_micros(micros: int) -> datetime:
+    """Return the local ``datetime`` for a stored Unix microsecond value."""
+    return datetime.fromtimestamp(micros / 1_000_000)
+
+
+def _format_seconds(seconds: float) -> str:
+    return _format_whole_seconds(int(seconds))
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_whole_seconds(seconds: int) -> str:
+    m, s = divmod(seconds, 60)
+    h, m = divmod(m, 60)
+    return f"{h:02}:{m:02}:{s:02}"
+
+
+class TimerState:
+    """Stopwatch/timer state of the running session."""
+
+    __slots__ = (
+        "start_time",
+        "start_monotonic",
+        "last_shown_sec",
+        "elapsed",
+        "mode",
+        "target_seconds",
+        "running",
+        "timer_job",
+    )
+
+    def __init__(self) -> None:
+        # Wall-clock start of the session, only used for the saved record
+        self.start_time: datetime | None = None
+        # Monotonic clock reading when the current run (start or resume)
+        # began; all elapsed-time accounting is based on this
+        self.start_monotonic: float = 0.0
+        # Whole second last written to the timer label
+        self.last_shown_sec: int = -1
+        self.elapsed: float = 0.0
+        # Mode selection: 'stopwatch' or 'timer'
+        self.mode: str = "stopwatch"
+        # For timer mode: target duration in seconds
+        self.target_seconds: float = 0.0
+        self.running: bool = False
+        self.timer_job: str | None = None
 
 
 class SessionDatabase:
     """Simple SQLite wrapper for storing study sessions."""
 
+    __slots__ = ("conn",)
+
     def __init__(self, db_path: Path):
-        self.conn = sqlite3.connect(db_path, detect_types=sqlite3.PARSE_DECLTYPES)
+        self.conn = sqlite3.connect(db_path, detect_types=sqlite3.PARSE_DECLTYPES, cached_statements=256)
+        # WAL with synchronous=NORMAL avoids a full fsync of the journal on
+        # every commit while staying crash safe for this workload.
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        # Sessions are written rarely, so let the WAL grow instead of
+        # checkpointing every few commits; ``close`` checkpoints on exit.
+        self.conn.execute("PRAGMA wal_autocheckpoint=10000")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA busy_timeout=5000")
+        self.conn.execute("PRAGMA cache_size=-8000")
         self._create_table()
 
     def _create_table(self) -> None:
-        self.conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS sessions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                start_time TEXT NOT NULL,
-                end_time TEXT,
-                duration REAL,
-                notes TEXT
-            );
-            """
-        )
-        self.conn.commit()
+        """Create the sessions table, migrating older databases if needed.
+
+        Timestamps are stored as integer Unix microseconds. Databases written
+        by earlier versions kept ISO 8601 text instead; those rows are
+        converted in place the first time the new schema is opened.
+        """
+        columns = {row[1]: row[2] for row in self.conn.execute("PRAGMA table_info(sessions)")}
+        legacy = columns.get("start_time") == "TEXT"
+        with self.conn:
+            if legacy:
+                self.conn.execute("BEGIN")
+                self.conn.execute("ALTER TABLE sessions RENAME TO sessions_legacy")
+            self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS sessions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    start_time INTEGER NOT NULL,
+                    end_time INTEGER,
+                    duration REAL,
+                    notes TEXT
+                );
+                """
+            )
+            if legacy:
+                rows = [
+                    (
+                        sid,
+                        _to_micros(datetime.fromisoformat(start)),
+                        _to_micros(datetime.fromisoformat(end)) if end else None,
+                        duration,
+                        notes,
+                    )
+                    for sid, start, end, duration, notes in self.conn.execute(
+                        "SELECT id, start_time, end_time, duration, notes FROM sessions_legacy"
+                    )
+                ]
+                self.conn.executemany(
+                    "INSERT INTO sessions (id, start_time, end_time, duration, notes) VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self.conn.execute("DROP TABLE sessions_legacy")
+            # Covers every column ``get_sessions`` reads in its page order,
+            # so each page is an index range scan without sorting.
+            self.conn.execute("DROP INDEX IF EXISTS idx_sessions_start")
+            self.conn.execute("DROP INDEX IF EXISTS idx_sessions_list")
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_sessions_page ON sessions (start_time DESC, id DESC, duration)"
+            )
 
     def add_session(self, start: datetime, end: datetime, duration: float, notes: str) -> None:
-        self.conn.execute(
-            "INSERT INTO sessions (start_time, end_time, duration, notes) VALUES (?, ?, ?, ?)",
-            (start.isoformat(), end.isoformat(), duration, notes),
-        )
-        self.conn.commit()
+        self.add_sessions([(_to_micros(start), _to_micros(end), duration, notes)])
+
+    def add_sessions(self, rows: Iterable[tuple[int, int, float, str]]) -> None:
+        """Insert several sessions in a single transaction.
+
+        Each row is a ``(start_time, end_time, duration, notes)`` tuple with
+        the times given in Unix microseconds. The transaction is committed
+        once at the end and rolled back on error.
+        """
+        with self.conn:
+            self.conn.executemany(_SQL_INSERT, rows)
 
     def get_all_sessions(self) -> list[tuple]:
-        cursor = self.conn.execute("SELECT id, start_time, duration FROM sessions ORDER BY start_time DESC")
+        return self.get_sessions(limit=-1)
+
+    def get_sessions(self, limit: int = SESSION_PAGE_SIZE, after: tuple[int, int] | None = None) -> list[tuple]:
+        """Return one page of ``(id, start, hours, minutes, seconds, start_time)`` rows.
+
+        Rows are ordered newest first. The start time is already formatted as
+        ``YYYY-MM-DD HH:MM`` in local time and the duration is split into
+        whole hours, minutes and seconds by SQLite, so callers only need to
+        build display strings. The raw ``start_time`` is included so the
+        caller can ask for the next page with ``after=(start_time, id)`` of
+        the last row; unlike an offset, this key is unaffected by sessions
+        added or deleted in between. A negative ``limit`` returns every row.
+        """
+        if after is None:
+            cursor = self.conn.execute(_SQL_LIST_FIRST, (limit,))
+        else:
+            cursor = self.conn.execute(_SQL_LIST_AFTER, (*after, limit))
         return cursor.fetchall()
 
     def get_session(self, session_id: int) -> tuple | None:
-        cursor = self.conn.execute("SELECT * FROM sessions WHERE id = ?", (session_id,))
+        cursor = self.conn.execute(_SQL_GET, (session_id,))
+        return cursor.fetchone()
+
+    def get_session_meta(self, session_id: int) -> tuple | None:
+        """Return ``(id, start_time, end_time, duration)`` without the notes."""
+        cursor = self.conn.execute(_SQL_GET_META, (session_id,))
         return cursor.fetchone()
 
     def delete_session(self, session_id: int) -> None:
@@ -81,9 +235,116 @@ class SessionDatabase:
         method. The method does not return a value but raises an exception
         if the delete fails.
         """
-        self.conn.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
+        self.conn.execute(_SQL_DELETE, (session_id,))
         self.conn.commit()
 
+    def close(self) -> None:
+        """Checkpoint the write-ahead log and close the connection."""
+        self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        self.conn.close()
+
+
+class SessionWriter:
+    """Persist sessions from a background thread.
+
+    ``add_session`` only queues the row, so the Tk event loop never waits on
+    the disk. The thread owns its own ``SessionDatabase`` connection and
+    writes whatever rows have queued up together in a single transaction.
+    Failures are kept for the Tk thread to collect with ``errors`` rather
+    than ending the thread.
+    """
+
+    __slots__ = ("_queue", "_errors", "_pending", "_lock", "_thread")
+
+    # Maximum number of queued rows written per transaction
+    BATCH_SIZE = 64
+
+    def __init__(self, db_path: Path):
+        self._queue: queue.Queue[tuple[int, int, float, str] | None] = queue.Queue()
+        self._errors: queue.Queue[Exception] = queue.Queue()
+        # Rows queued but not yet handled by the writer thread
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, args=(db_path,), daemon=True)
+        self._thread.start()
+
+    def add_session(self, start: datetime, end: datetime, duration: float, notes: str) -> None:
+        with self._lock:
+            self._pending += 1
+        self._queue.put((_to_micros(start), _to_micros(end), duration, notes))
+
+    def is_alive(self) -> bool:
+        return self._thread.is_alive()
+
+    def pending(self) -> bool:
+        """Return whether any queued session has not been handled yet."""
+        with self._lock:
+            return self._pending > 0
+
+    def errors(self) -> list[Exception]:
+        """Return and clear the failures reported by the writer thread."""
+        found = []
+        while True:
+            try:
+                found.append(self._errors.get_nowait())
+            except queue.Empty:
+                return found
+
+    def take_unwritten(self) -> list[tuple[int, int, float, str]]:
+        """Remove and return the rows left in the queue.
+
+        Only meaningful once the writer thread has stopped, so the caller can
+        write the rows itself instead of losing them.
+        """
+        rows = []
+        while True:
+            try:
+                row = self._queue.get_nowait()
+            except queue.Empty:
+                return rows
+            if row is not None:
+                rows.append(row)
+
+    def close(self) -> None:
+        """Write any queued sessions and stop the background thread."""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self, db_path: Path) -> None:
+        try:
+            db = SessionDatabase(db_path)
+        except Exception as exc:  # pragma: no cover - defensive
+            # Queued rows stay in the queue for ``take_unwritten``
+            self._errors.put(exc)
+            return
+        try:
+            while True:
+                rows = [self._queue.get()]
+                while len(rows) < self.BATCH_SIZE:
+                    try:
+                        rows.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                # ``None`` is the shutdown sentinel queued by ``close``
+                done = None in rows
+                rows = [row for row in rows if row is not None]
+                try:
+                    db.add_sessions(rows)
+                except Exception:
+                    # Retry one row at a time so a single bad row does not
+                    # take the rest of the batch with it.
+                    for row in rows:
+                        try:
+                            db.add_sessions([row])
+                        except Exception as exc:
+                            self._errors.put(exc)
+                with self._lock:
+                    self._pending -= len(rows)
+                if done:
+                    return
+        finally:
+            db.close()
+
 
 class StudyTrackerApp(tk.Tk):
     def __init__(self):
@@ -113,19 +374,25 @@ class StudyTrackerApp(tk.Tk):
         self.resizable(True, True)
 
         self.db = SessionDatabase(DB_PATH)
+        self._writer = SessionWriter(DB_PATH)
+        self._writer_job: str | None = None
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.bind("<Map>", self._on_map)
 
         # State variables
-        self._start_time: datetime | None = None
-        self._elapsed: float = 0.0
-        # New: mode selection: 'stopwatch' or 'timer'
-        self._mode: str = "stopwatch"
-        # For timer mode: target duration in seconds
-        self._target_seconds: float = 0.0
-        self._running: bool = False
-        self._timer_job: int | None = None
+        self._state = TimerState()
 
         self._create_widgets()
 
+    def _on_close(self) -> None:
+        """Flush the database and destroy the main window."""
+        self._writer.close()
+        if self._writer_job is not None:
+            self.after_cancel(self._writer_job)
+        self._check_writer()
+        self.db.close()
+        self.destroy()
+
     # ---------------------------------------------------------------------
     # UI Setup
     # ---------------------------------------------------------------------
@@ -139,7 +406,7 @@ class StudyTrackerApp(tk.Tk):
         mode_frame = ttk.Frame(main_frame)
         mode_frame.grid(row=0, column=0, sticky="w", pady=(0, 10))
         ttk.Label(mode_frame, text="Mode:").grid(row=0, column=0, padx=5)
-        mode_var = tk.StringVar(value=self._mode)
+        mode_var = tk.StringVar(value=self._state.mode)
         self._mode_var = mode_var
         ttk.Radiobutton(mode_frame, text="Stopwatch", variable=mode_var, value="stopwatch", command=self._on_mode_change).grid(row=0, column=1, padx=5)
         ttk.Radiobutton(mode_frame, text="Timer", variable=mode_var, value="timer", command=self._on_mode_change).grid(row=0, column=2, padx=5)
@@ -180,51 +447,73 @@ class StudyTrackerApp(tk.Tk):
 
         When the mode changes, reset any running session and update the UI.
         """
-        self._mode = self._mode_var.get()
+        self._state.mode = self._mode_var.get()
         # Reset session if running
-        if self._running or self._elapsed > 0:
+        if self._state.running or self._state.elapsed > 0:
             # Stop current session and reset display
             self.stop_session()
         # Update timer label to zero
         self.timer_label.config(text="00:00:00")
         # Reset target seconds when leaving timer mode
-        self._target_seconds = 0.0
+        self._state.target_seconds = 0.0
 
     # ---------------------------------------------------------------------
     # Timer logic
     # ---------------------------------------------------------------------
     def _update_timer(self) -> None:
-        if not self._running:
+        # Any scheduled tick has fired by now; it is set again below only if
+        # the timer keeps running.
+        self._state.timer_job = None
+        if not self._state.running:
             return
-        now = datetime.now()
-        if self._mode == "stopwatch":
-            elapsed = (now - self._start_time).total_seconds() + self._elapsed
-            self.timer_label.config(text=self._format_seconds(elapsed))
+        elapsed = time.monotonic() - self._state.start_monotonic + self._state.elapsed
+        # Only touch the label when the displayed second changes and the
+        # window is not minimised.  The timer target is a whole number of
+        # seconds, so the remaining time rolls over on the same boundaries
+        # as the elapsed time.
+        whole = int(elapsed)
+        iconified = self._is_iconified()
+        redraw = whole != self._state.last_shown_sec and not iconified
+        if self._state.mode == "stopwatch":
+            if redraw:
+                self.timer_label.config(text=_format_seconds(elapsed))
         else:  # timer mode
-            elapsed = (now - self._start_time).total_seconds() + self._elapsed
-            remaining = max(self._target_seconds - elapsed, 0)
-            self.timer_label.config(text=self._format_seconds(remaining))
+            remaining = max(self._state.target_seconds - elapsed, 0)
+            if redraw:
+                self.timer_label.config(text=_format_seconds(remaining))
             if remaining <= 0:
                 # Timer finished automatically
                 self.stop_session()
                 return
-        # schedule next update
-        self._timer_job = self.after(200, self._update_timer)
+        if redraw:
+            self._state.last_shown_sec = whole
+        if iconified:
+            delay = 1000
+        else:
+            # schedule next update just after the next whole second
+            delay = max(50, 1000 - int(elapsed % 1 * 1000))
+        self._state.timer_job = self.after(delay, self._update_timer)
 
-    @staticmethod
-    def _format_seconds(seconds: float) -> str:
-        m, s = divmod(int(seconds), 60)
-        h, m = divmod(m, 60)
-        return f"{h:02}:{m:02}:{s:02}"
+    def _is_iconified(self) -> bool:
+        try:
+            return self.state() == "iconic"
+        except tk.TclError:
+            return False
+
+    def _on_map(self, event: tk.Event) -> None:
+        """Repaint the timer as soon as the main window is restored."""
+        if event.widget is self and self._state.timer_job is not None:
+            self.after_cancel(self._state.timer_job)
+            self._update_timer()
 
     # ---------------------------------------------------------------------
     # Control callbacks
     # ---------------------------------------------------------------------
     def start_session(self) -> None:
-        if self._running:
+        if self._state.running:
             return
         # For timer mode, prompt for duration
-        if self._mode == "timer":
+        if self._state.mode == "timer":
             # Prompt for hours (allow fractions like 1.5)
             hours = simpledialog.askfloat(
                 "Timer duration", "Enter hours (e.g., 1.5 for 1h30m):", parent=self, minvalue=0.01
@@ -234,14 +523,16 @@ class StudyTrackerApp(tk.Tk):
             # Clamp to maximum 99.9999 hours (~5999 minutes)
             if hours > 99.9999:
                 hours = 99.9999
-            self._target_seconds = int(hours * 3600)
+            self._state.target_seconds = int(hours * 3600)
             # Reset elapsed for new session
-            self._elapsed = 0.0
+            self._state.elapsed = 0.0
         else:
             # Stopwatch mode
-            self._target_seconds = 0.0
-        self._start_time = datetime.now()
-        self._running = True
+            self._state.target_seconds = 0.0
+        self._state.last_shown_sec = -1
+        self._state.start_time = datetime.now()
+        self._state.start_monotonic = time.monotonic()
+        self._state.running = True
         self._update_timer()
         self.start_btn.config(state="disabled")
         self.pause_btn.config(state="normal")
@@ -249,20 +540,20 @@ class StudyTrackerApp(tk.Tk):
         self.resume_btn.config(state="disabled")
 
     def pause_session(self) -> None:
-        if not self._running:
+        if not self._state.running:
             return
-        self.after_cancel(self._timer_job)  # type: ignore[arg-type]
-        now = datetime.now()
-        self._elapsed += (now - self._start_time).total_seconds()
-        self._running = False
+        self.after_cancel(self._state.timer_job)  # type: ignore[arg-type]
+        self._state.timer_job = None
+        self._state.elapsed += time.monotonic() - self._state.start_monotonic
+        self._state.running = False
         self.pause_btn.config(state="disabled")
         self.resume_btn.config(state="normal")
 
     def resume_session(self) -> None:
-        if self._running:
+        if self._state.running:
             return
-        self._start_time = datetime.now()
-        self._running = True
+        self._state.start_monotonic = time.monotonic()
+        self._state.running = True
         self._update_timer()
         self.pause_btn.config(state="normal")
         self.resume_btn.config(state="disabled")
@@ -273,40 +564,42 @@ class StudyTrackerApp(tk.Tk):
         The original implementation failed to record the full duration for
         timer sessions that finished automatically (i.e. the timer reached
         zero without the user clicking Stop).  We now compute the elapsed
-        time unconditionally and use ``_target_seconds`` for the duration
+        time unconditionally and use ``target_seconds`` for the duration
         when the timer mode is active and the elapsed time has reached the
         target.
         """
-        if not (self._running or self._elapsed > 0):
+        if not (self._state.running or self._state.elapsed > 0):
             messagebox.showinfo("No session", "No active session to stop.")
             return
 
         # Compute elapsed time.  When the session is still running we need to
         # add the time since the last start; when paused we already have the
-        # full elapsed time in ``_elapsed``.
-        now = datetime.now()
-        if self._running:
-            elapsed = (now - self._start_time).total_seconds() + self._elapsed
+        # full elapsed time in ``elapsed``.
+        if self._state.running:
+            elapsed = time.monotonic() - self._state.start_monotonic + self._state.elapsed
         else:
-            elapsed = self._elapsed
-        start_time = self._start_time
+            elapsed = self._state.elapsed
+        start_time = self._state.start_time
 
         # If the timer finished automatically, record the target duration
-        if self._mode == "timer" and elapsed >= self._target_seconds:
-            duration = self._target_seconds
+        if self._state.mode == "timer" and elapsed >= self._state.target_seconds:
+            duration = self._state.target_seconds
         else:
             duration = elapsed
 
-        # Fetch notes and persist session
+        end_time = datetime.now()
         notes = self.notes_text.get("1.0", tk.END).strip()
-        self.db.add_session(start=start_time, end=now, duration=duration, notes=notes)
-        messagebox.showinfo("Session Saved", f"Session of {self._format_seconds(duration)} saved.")
-
-        # Reset state and UI
-        self._running = False
-        self._elapsed = 0.0
-        self._start_time = None
-        self._target_seconds = 0.0
+
+        # Reset state and UI before saving: the confirmation dialog runs a
+        # nested event loop, and pending ticks or ``<Map>`` must not see a
+        # running session and stop it a second time.
+        if self._state.timer_job is not None:
+            self.after_cancel(self._state.timer_job)
+            self._state.timer_job = None
+        self._state.running = False
+        self._state.elapsed = 0.0
+        self._state.start_time = None
+        self._state.target_seconds = 0.0
         self.timer_label.config(text="00:00:00")
         self.start_btn.config(state="normal")
         self.pause_btn.config(state="disabled")
@@ -314,6 +607,48 @@ class StudyTrackerApp(tk.Tk):
         self.stop_btn.config(state="disabled")
         self.notes_text.delete("1.0", tk.END)
 
+        # Persist the session
+        self._save_session(start=start_time, end=end_time, duration=duration, notes=notes)
+
+    def _save_session(self, start: datetime, end: datetime, duration: float, notes: str) -> None:
+        """Hand a finished session to the background writer.
+
+        If the writer thread is no longer running the session is written
+        directly so it is never dropped.
+        """
+        shown = _format_seconds(duration)
+        if not self._writer.is_alive():
+            try:
+                self.db.add_session(start=start, end=end, duration=duration, notes=notes)
+            except Exception as exc:  # pragma: no cover - defensive
+                messagebox.showerror("Error", f"Failed to save session: {exc}")
+                return
+            messagebox.showinfo("Session Saved", f"Session of {shown} saved.")
+            return
+        self._writer.add_session(start=start, end=end, duration=duration, notes=notes)
+        if self._writer_job is None:
+            self._writer_job = self.after(250, self._check_writer)
+        messagebox.showinfo("Session Stopped", f"Session of {shown} is being saved.")
+
+    def _check_writer(self) -> None:
+        """Report write failures and poll until queued sessions are handled."""
+        self._writer_job = None
+        # Read ``pending`` before draining errors: the writer reports a
+        # failure before marking its rows handled, so this order cannot miss
+        # an error queued between the two calls.
+        pending = self._writer.pending()
+        for exc in self._writer.errors():
+            messagebox.showerror("Error", f"Failed to save session: {exc}")
+        if not self._writer.is_alive():
+            rows = self._writer.take_unwritten()
+            if rows:
+                try:
+                    self.db.add_sessions(rows)
+                except Exception as exc:  # pragma: no cover - defensive
+                    messagebox.showerror("Error", f"Failed to save {len(rows)} session(s): {exc}")
+        elif pending:
+            self._writer_job = self.after(250, self._check_writer)
+
     # ---------------------------------------------------------------------
     # Session viewer
     # ---------------------------------------------------------------------
@@ -334,34 +669,76 @@ class StudyTrackerApp(tk.Tk):
         tree.pack(side="left", fill="both", expand=True, padx=5, pady=5)
         scrollbar = ttk.Scrollbar(win, orient="vertical", command=tree.yview)
         scrollbar.pack(side="right", fill="y")
-        tree.configure(yscrollcommand=scrollbar.set)
 
-        # Populate
-        sessions = self.db.get_all_sessions()
-        for sess in sessions:
-            sid, start_str, dur = sess
-            start = datetime.fromisoformat(start_str)
-            tree.insert("", "end", values=(sid, start.strftime("%Y-%m-%d %H:%M"), self._format_seconds(dur)))
+        # Populate one page at a time; further pages are fetched as the
+        # view is scrolled close to the last loaded row.  Nothing is loaded
+        # until ``first_page`` has let queued writes reach the database.
+        last_key: tuple[int, int] | None = None
+        exhausted = True
+
+        def load_page() -> None:
+            nonlocal last_key, exhausted
+            if exhausted:
+                return
+            rows = self.db.get_sessions(limit=SESSION_PAGE_SIZE, after=last_key)
+            self._insert_session_rows(tree, rows)
+            if rows:
+                last_key = (rows[-1][5], rows[-1][0])
+            exhausted = len(rows) < SESSION_PAGE_SIZE
+
+        def reload() -> None:
+            nonlocal last_key, exhausted
+            tree.delete(*tree.get_children())
+            last_key = None
+            exhausted = False
+            load_page()
+
+        def on_scroll(first: str, last: str) -> None:
+            scrollbar.set(first, last)
+            if float(last) > 0.9:
+                load_page()
+
+        def first_page() -> None:
+            # Sessions just stopped may still be queued in the writer; wait
+            # for them so the list includes them.
+            if not win.winfo_exists():
+                return
+            if self._writer.is_alive() and self._writer.pending():
+                win.after(50, first_page)
+            else:
+                reload()
+
+        tree.configure(yscrollcommand=on_scroll)
+        first_page()
 
         # Buttons
         btn_frame = ttk.Frame(win)
         btn_frame.pack(pady=5)
-        delete_btn = ttk.Button(btn_frame, text="Delete Selected", style="White.TButton", command=lambda: self._delete_selected_session(tree, sessions))
+        delete_btn = ttk.Button(btn_frame, text="Delete Selected", style="White.TButton", command=lambda: self._delete_selected_session(tree, reload))
         delete_btn.grid(row=0, column=0, padx=5)
-        open_btn = ttk.Button(btn_frame, text="Open Session", style="White.TButton", command=lambda: self._open_selected_sessions(tree, sessions))
+        open_btn = ttk.Button(btn_frame, text="Open Session", style="White.TButton", command=lambda: self._open_selected_sessions(tree))
         open_btn.grid(row=0, column=1, padx=5)
 
+    @staticmethod
+    def _insert_session_rows(tree: ttk.Treeview, rows: list[tuple]) -> None:
+        """Append rows from ``db.get_sessions`` to the treeview.
+
+        ``ttk.Treeview.insert`` adds a single item per call, so the loop is
+        run inside Tcl to fill a whole page with one call from Python.
+        """
+        values = [(sid, start, f"{h:02}:{m:02}:{s:02}") for sid, start, h, m, s, _ in rows]
+        if values:
+            # ``apply`` keeps the loop variable local to the Tcl lambda
+            tree.tk.call("apply", _TCL_INSERT_ROWS, tree, values)
+
     def _show_session_detail(self, start: str, end: str, duration: float, notes: str) -> None:
         win = tk.Toplevel(self)
         win.title("Session Detail")
         win.geometry("400x300")
-        txt = tk.Text(win, wrap="word", height=15, width=50)
+        txt = tk.Text(win, wrap="word", height=15, width=50, bg="white", fg="black")
         txt.pack(padx=10, pady=10)
-        txt.config(bg="white", fg="black")
-        txt.insert(tk.END, f"Start: {start}\n")
-        txt.insert(tk.END, f"End: {end}\n")
-        txt.insert(tk.END, f"Duration: {self._format_seconds(duration)}\n\n")
-        txt.insert(tk.END, f"Notes:\n{notes}")
+        body = f"Start: {start}\nEnd: {end}\nDuration: {_format_seconds(duration)}\n\nNotes:\n{notes}"
+        txt.insert("1.0", body)
         txt.config(state="disabled")
 
     # -----------------------------------------------------------------
@@ -371,7 +748,7 @@ class StudyTrackerApp(tk.Tk):
         """Create a minimal menu bar with File and Help options."""
         menubar = tk.Menu(self)
         file_menu = tk.Menu(menubar, tearoff=0)
-        file_menu.add_command(label="Exit", command=self.quit)
+        file_menu.add_command(label="Exit", command=self._on_close)
         menubar.add_cascade(label="File", menu=file_menu)
         help_menu = tk.Menu(menubar, tearoff=0)
         help_menu.add_command(label="About", command=self._show_about)
@@ -385,15 +762,15 @@ class StudyTrackerApp(tk.Tk):
             "Study Tracker – a lightweight stopwatch and timer for study sessions.\n\nAuthor: moontato",
         )
 
-    def _delete_selected_session(self, tree: ttk.Treeview, sessions: list[tuple]) -> None:
+    def _delete_selected_session(self, tree: ttk.Treeview, reload: Callable[[], None]) -> None:
         """Delete the session(s) currently selected in the treeview.
 
         Parameters
         ----------
         tree:
             The treeview widget containing session items.
-        sessions:
-            The list of session tuples as returned by ``db.get_all_sessions``.
+        reload:
+            Callback that clears the treeview and loads the first page again.
         """
         selection = tree.selection()
         if not selection:
@@ -416,19 +793,9 @@ class StudyTrackerApp(tk.Tk):
         except Exception as exc:  # pragma: no cover - defensive
             messagebox.showerror("Error", f"Failed to delete sessions: {exc}")
         # Refresh treeview
-        for item in tree.get_children():
-            tree.delete(item)
-        # Re‑populate
-        new_sessions = self.db.get_all_sessions()
-        for sess in new_sessions:
-            sid, start_str, dur = sess
-            start = datetime.fromisoformat(start_str)
-            tree.insert("", "end", values=(sid, start.strftime("%Y-%m-%d %H:%M"), self._format_seconds(dur)))
-        # Update the external ``sessions`` list reference so subsequent
-        # deletes reference the new order.
-        sessions[:] = new_sessions
-
-    def _open_selected_sessions(self, tree: ttk.Treeview, sessions: list[tuple]) -> None:
+        reload()
+
+    def _open_selected_sessions(self, tree: ttk.Treeview) -> None:
         """Open the detail view for each selected session.
 
         The function supports opening multiple sessions in separate windows.
@@ -442,8 +809,10 @@ class StudyTrackerApp(tk.Tk):
             sess_id = int(tree.item(idx)["values"][0])
             session = self.db.get_session(sess_id)
             if session:
-                _, start_time, end_time, duration, notes = session
-                self._show_session_detail(start_time, end_time, duration, notes)
+                _, start_us, end_us, duration, notes = session
+                start = _from_micros(start_us).isoformat(sep=" ", timespec="seconds")
+                end = _from_micros(end_us).isoformat(sep=" ", timespec="seconds") if end_us else ""
+                self._show_session_detail(start, end, duration, notes)
 
 
 if __name__ == "__main__":